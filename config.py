@@ -3,11 +3,36 @@ Keeping all tweakable parameters in one place improves maintainability
 and avoids scattering magic numbers throughout the codebase.
 """
 
+from functools import lru_cache
+import re
+
+try:  # google-re2 matches in linear time without backtracking
+    import re2 as _re_engine  # type: ignore
+except ImportError:
+    _re_engine = re
+
 # -----------------------------
 # File-handling configuration
 # -----------------------------
 MAX_FILE_SIZE: int = 200  # megabytes
 
+# Delimited files with more data rows than this are rejected while streaming
+MAX_UPLOAD_ROWS: int = 20_000_000
+
+# Parsed uploads kept in memory, keyed by file content, so reruns skip parsing
+PARSE_CACHE_ENTRIES: int = 16
+
+# Seconds a parsed upload stays in that cache, so large files are not pinned
+# in memory for the life of the process
+PARSE_CACHE_TTL: int = 30 * 60
+
+# Rendered chart figures kept per process, keyed by data and settings
+CHART_CACHE_ENTRIES: int = 32
+
+# Text columns with fewer distinct values than this fraction of rows are
+# stored as ``category`` on ingest
+CATEGORY_MAX_UNIQUE_RATIO: float = 0.5
+
 SUPPORTED_EXTENSIONS = {
     ".csv": "CSV",
     ".xlsx": "Excel",
@@ -29,6 +54,18 @@ DATE_PATTERNS = [
     r"\d{4}\d{2}\d{2}",         # YYYYMMDD
 ]
 
+# All DATE_PATTERNS as one alternation, so a value is scanned once rather
+# than once per pattern.  Alternative *i* is the named group ``p<i>``; a
+# match's ``lastgroup`` maps back to the pattern through DATE_PATTERN_GROUPS.
+DATE_PATTERN_GROUPS = {f"p{i}": p for i, p in enumerate(DATE_PATTERNS)}
+DATE_PATTERN_RE = _re_engine.compile(
+    "|".join(f"(?P<{name}>{p})" for name, p in DATE_PATTERN_GROUPS.items())
+)
+
+# Rows inspected per column when sniffing for datetime columns.  Detection
+# cost is bounded by this, independent of dataset length.
+DETECTION_SAMPLE_SIZE: int = 100
+
 DATETIME_FORMATS = [
     "%Y-%m-%d",
     "%Y/%m/%d",
@@ -54,30 +91,40 @@ DATETIME_FORMATS = [
 # -----------------------------
 # Plotting defaults
 # -----------------------------
-from plotly import express as _px  # type: ignore
-
-COLOR_PALETTES = {
-    "Default": _px.colors.qualitative.Plotly,
-    "Viridis": _px.colors.sequential.Viridis,
-    "Blues": _px.colors.sequential.Blues,
-    "Reds": _px.colors.sequential.Reds,
-    "Greens": _px.colors.sequential.Greens,
-    "Rainbow": _px.colors.qualitative.Set1,
-    "Pastel": _px.colors.qualitative.Pastel,
-    "Dark24": _px.colors.qualitative.Dark24,
-    "Professional": [
-        "#1f77b4",
-        "#ff7f0e",
-        "#2ca02c",
-        "#d62728",
-        "#9467bd",
-        "#8c564b",
-        "#e377c2",
-        "#7f7f7f",
-        "#bcbd22",
-        "#17becf",
-    ],
-}
+
+
+@lru_cache(maxsize=None)
+def get_color_palettes() -> dict:
+    """Return the named colour palettes.
+
+    Built on first use so that importing ``config`` does not pull in Plotly
+    Express (and its pandas/numpy/narwhals imports) on pages that never plot.
+    """
+    from plotly import colors as _colors  # type: ignore  # same module as px.colors
+
+    return {
+        "Default": _colors.qualitative.Plotly,
+        "Viridis": _colors.sequential.Viridis,
+        "Blues": _colors.sequential.Blues,
+        "Reds": _colors.sequential.Reds,
+        "Greens": _colors.sequential.Greens,
+        "Rainbow": _colors.qualitative.Set1,
+        "Pastel": _colors.qualitative.Pastel,
+        "Dark24": _colors.qualitative.Dark24,
+        "Professional": [
+            "#1f77b4",
+            "#ff7f0e",
+            "#2ca02c",
+            "#d62728",
+            "#9467bd",
+            "#8c564b",
+            "#e377c2",
+            "#7f7f7f",
+            "#bcbd22",
+            "#17becf",
+        ],
+    }
+
 
 DEFAULT_PLOT_CONFIG = {
     "theme": "plotly_white",
@@ -88,3 +135,8 @@ DEFAULT_PLOT_CONFIG = {
     "marker_size": 6,
     "opacity": 0.8,
 }
+
+# Line/scatter/area charts above this many rows are LTTB-downsampled to
+# DOWNSAMPLE_POINTS points per series before being sent to the browser.
+DOWNSAMPLE_THRESHOLD: int = 50_000
+DOWNSAMPLE_POINTS: int = 2_000
@@ -7,13 +7,15 @@ and logic preserved.
 
 from __future__ import annotations
 
+from datetime import datetime
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime
 
 # Internal utilities
-from utils.session_init import ensure_session_state
+from utils.date_analysis import analyze_datetime_columns
+from utils.session_init import ensure_session_state, forget_dataset_state
 
 # Ensure common objects exist
 ensure_session_state()
@@ -21,6 +23,38 @@ ensure_session_state()
 # Convenience aliases
 fh = st.session_state.file_handler
 
+
+@st.cache_data(show_spinner=False)
+def _make_sample_data(start: str, end: str) -> pd.DataFrame:
+    """Build the synthetic weather & sales series for the given date range."""
+    dates = pd.date_range(start=start, end=end, freq="D")
+    n = len(dates)
+    rng = np.random.default_rng(42)
+    phase = (2 * np.pi / 365.0) * np.arange(n, dtype=np.float32)
+
+    def wave(base: float, amplitude: float, shift: float, noise: float) -> np.ndarray:
+        # base + amplitude * sin(phase + shift) + N(0, noise), built in one buffer
+        col = np.add(phase, np.float32(shift))
+        np.sin(col, out=col)
+        col *= np.float32(amplitude)
+        col += np.float32(base)
+        col += rng.standard_normal(n, dtype=np.float32) * np.float32(noise)
+        return col
+
+    sales = wave(1000, 500, 0, 100)
+    np.maximum(sales, np.float32(0), out=sales)
+
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Temperature": wave(20, 10, 0, 2),
+            "Humidity": wave(50, 20, np.pi / 4, 5),
+            "Pressure": wave(1013, 10, np.pi / 2, 3),
+            "Sales": sales,
+        }
+    )
+
+
 # -----------------------------------------------------------------------------
 # Page UI
 # -----------------------------------------------------------------------------
@@ -38,33 +72,59 @@ with col1:
         accept_multiple_files=True,
         help="Supported formats: CSV, Excel (.xlsx, .xls), JSON, TSV",
     )
+    use_arrow_dtypes = st.checkbox(
+        "Use Arrow-backed dtypes",
+        value=False,
+        help="Store columns as PyArrow arrays – lower memory use, especially for text columns",
+    )
+    dtype_backend = "pyarrow" if use_arrow_dtypes else None
 
     if uploaded_files:
-        for uploaded_file in uploaded_files:
-            # Validate file
-            is_valid, error_message = fh.validate_file(uploaded_file)
-
-            if is_valid:
-                with st.spinner(f"Processing {uploaded_file.name}..."):
-                    df, error = fh.read_file(uploaded_file)
-
-                    if df is not None:
-                        file_key = uploaded_file.name
-                        fh.add_dataset(
-                            file_key,
-                            df,
-                            {
-                                "filename": uploaded_file.name,
-                                "size": uploaded_file.size,
-                                "upload_time": datetime.now(),
-                                "type": uploaded_file.type,
-                            },
-                        )
-                        st.success(f"✅ Successfully loaded {uploaded_file.name}")
-                    else:
-                        st.error(f"❌ Error loading {uploaded_file.name}: {error}")
-            else:
+        validations = [fh.validate_file(f) for f in uploaded_files]
+        digests = {
+            f.name: fh.content_digest(f)
+            for f, (is_valid, _) in zip(uploaded_files, validations)
+            if is_valid
+        }
+        # The uploader keeps its files across reruns; only files not already
+        # loaded with the same content are parsed and added again.
+        pending = [
+            f for f in uploaded_files
+            if f.name in digests and not fh.is_loaded(f.name, digests[f.name], dtype_backend)
+        ]
+        parsed = {}
+        if pending:
+            # Files are read concurrently; session state is only touched
+            # below, back on the script thread.
+            with st.status(f"Processing {len(pending)} file(s)...") as status:
+                parsed = fh.read_files(pending, dtype_backend, digests)
+                status.update(label=f"Processed {len(pending)} file(s)", state="complete")
+
+        for uploaded_file, (is_valid, error_message) in zip(uploaded_files, validations):
+            if not is_valid:
                 st.error(f"❌ {uploaded_file.name}: {error_message}")
+                continue
+            if uploaded_file.name not in parsed:
+                st.success(f"✅ Successfully loaded {uploaded_file.name}")
+                continue
+            df, error = parsed[uploaded_file.name]
+            if df is not None:
+                file_key = uploaded_file.name
+                fh.add_dataset(
+                    file_key,
+                    df,
+                    {
+                        "filename": uploaded_file.name,
+                        "size": uploaded_file.size,
+                        "upload_time": datetime.now(),
+                        "type": uploaded_file.type,
+                        "digest": digests[uploaded_file.name],
+                        "dtype_backend": dtype_backend,
+                    },
+                )
+                st.success(f"✅ Successfully loaded {uploaded_file.name}")
+            else:
+                st.error(f"❌ Error loading {uploaded_file.name}: {error}")
 
 with col2:
     st.markdown("### Quick Stats")
@@ -75,7 +135,7 @@ with col2:
         total_rows = sum(len(df) for df in datasets.values())
         st.metric("Total Rows", f"{total_rows:,}")
         total_memory = (
-            sum(df.memory_usage(deep=True).sum() for df in datasets.values())
+            sum(fh.get_dataset_stats(name)["memory_usage"] for name in datasets)
             / (1024 * 1024)
         )
         st.metric("Memory Usage", f"{total_memory:.1f} MB")
@@ -90,12 +150,11 @@ if fh.get_dataset_names():
         with st.expander(f"📄 {dataset_name}", expanded=False):
             col1, col2, col3 = st.columns([3, 1, 1])
 
-            df = fh.get_dataset(dataset_name)
             stats = fh.get_dataset_stats(dataset_name)
 
             with col1:
                 st.write("**Preview:**")
-                st.dataframe(df.head(), use_container_width=True)
+                st.dataframe(fh.get_dataset_preview(dataset_name), use_container_width=True)
                 st.write("**Statistics:**")
                 st.write(f"• **Rows:** {stats['rows']:,}")
                 st.write(f"• **Columns:** {stats['columns']}")
@@ -106,40 +165,19 @@ if fh.get_dataset_names():
             with col2:
                 st.write("**Actions:**")
                 if st.button("🔍 Analyze Dates", key=f"analyze_{dataset_name}"):
-                    from pages.utils_date_analysis import analyze_datetime_columns  # lazily import helper
                     analyze_datetime_columns(dataset_name)
 
             with col3:
                 st.write("**Remove:**")
                 if st.button("🗑️ Delete", key=f"delete_{dataset_name}"):
                     fh.remove_dataset(dataset_name)
+                    forget_dataset_state(dataset_name)
                     st.rerun()
 
 # Sample data option
 st.markdown("### 🎯 Try with Sample Data")
 if st.button("Load Sample Time Series Data"):
-    dates = pd.date_range(start="2020-01-01", end="2023-12-31", freq="D")
-    np.random.seed(42)
-    sample_data = pd.DataFrame(
-        {
-            "Date": dates,
-            "Temperature": 20
-            + 10 * np.sin(2 * np.pi * np.arange(len(dates)) / 365)
-            + np.random.normal(0, 2, len(dates)),
-            "Humidity": 50
-            + 20 * np.sin(2 * np.pi * np.arange(len(dates)) / 365 + np.pi / 4)
-            + np.random.normal(0, 5, len(dates)),
-            "Pressure": 1013
-            + 10 * np.sin(2 * np.pi * np.arange(len(dates)) / 365 + np.pi / 2)
-            + np.random.normal(0, 3, len(dates)),
-            "Sales": np.maximum(
-                0,
-                1000
-                + 500 * np.sin(2 * np.pi * np.arange(len(dates)) / 365)
-                + np.random.normal(0, 100, len(dates)),
-            ),
-        }
-    )
+    sample_data = _make_sample_data("2020-01-01", "2023-12-31")
 
     fh.add_dataset(
         "Sample Weather & Sales Data",
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional, Any, Dict, List
 
 import streamlit as st
 import pandas as pd
 
+from utils.date_analysis import detect_datetime_columns_cached
 from utils.session_init import ensure_session_state
 
 ensure_session_state()
@@ -35,12 +37,16 @@ def parse_time_column(dataset_name: str, time_column: str, custom_format: Option
             "errors": errors,
         }
 
-        df_updated = df.copy()
-        df_updated[f"{time_column}_parsed"] = parsed_series
+        # Keep only the parsed column; the visualization page attaches it to
+        # the stored dataset on demand instead of holding a full copy here.
         st.session_state.parsed_datasets[dataset_name] = {
-            "data": df_updated,
+            "data_name": dataset_name,
+            "parsed_series": parsed_series,
             "time_column": f"{time_column}_parsed",
             "original_time_column": time_column,
+            "parsed_at": datetime.now(),
+            # The parsed column only lines up with this exact upload
+            "source_token": fh.get_dataset_token(dataset_name),
         }
 
 
@@ -85,7 +91,7 @@ def manual_time_selection(dataset_name: str, df: pd.DataFrame) -> None:
     with col1:
         time_column = st.selectbox("Select time column:", options=df.columns.tolist())
         st.write("**Sample values:**")
-        st.write(df[time_column].head().tolist())
+        st.dataframe(df[[time_column]].head(), use_container_width=True)
     with col2:
         custom_format = st.text_input("Custom format (optional):", placeholder="%Y-%m-%d")
         if st.button("Parse Column"):
@@ -114,7 +120,7 @@ col1, col2 = st.columns([1, 1])
 with col1:
     if st.button("🚀 Auto-Detect Time Columns"):
         with st.spinner("Analyzing columns..."):
-            datetime_candidates = parser.detect_datetime_columns(df)
+            datetime_candidates = detect_datetime_columns_cached(df)
             st.session_state[f"datetime_candidates_{selected_dataset}"] = datetime_candidates
 with col2:
     if st.button("🔄 Refresh Analysis"):
@@ -9,8 +9,8 @@ from typing import List, Dict, Any, Optional
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 
+import config
 from utils.session_init import ensure_session_state
 
 # Make sure shared objects exist
@@ -19,6 +19,71 @@ ensure_session_state()
 pg: "PlotGenerator" = st.session_state.plot_generator  # type: ignore
 fh = st.session_state.file_handler
 
+# Chart-type label -> utils.plot.create_plot kind
+_CHART_KINDS = {
+    "Line Chart": "line",
+    "Scatter Plot": "scatter",
+    "Area Chart": "area",
+    "Bar Chart": "bar",
+    "Box Plot": "box",
+}
+
+# Kinds whose builders LTTB-downsample large inputs (one mark per row); bar
+# and box charts aggregate and keep every row.
+_DOWNSAMPLED_KINDS = {"line", "scatter", "area"}
+
+
+@st.cache_data(show_spinner=False)
+def _numeric_cols(dataset_name: str, columns: tuple, dtypes: tuple) -> List[str]:
+    """Names of the numeric (non-boolean) columns, matching ``select_dtypes(np.number)``.
+
+    Keyed on the column names and dtype strings, so it only reruns when the
+    schema changes rather than walking the frame's blocks on every rerun.
+    """
+    numeric: List[str] = []
+    for col, dtype_str in zip(columns, dtypes):
+        try:
+            dtype = pd.api.types.pandas_dtype(dtype_str)
+        except (TypeError, ValueError):
+            continue
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            numeric.append(col)
+    return numeric
+
+
+@st.cache_data(show_spinner=False, max_entries=config.CHART_CACHE_ENTRIES)
+def _build_chart(
+    kind: str,
+    dataset_name: str,
+    dataset_token: Optional[str],
+    parsed_at: Any,
+    shape: tuple,
+    time_column: str,
+    variables: tuple,
+    trace_config: tuple,
+    _df: pd.DataFrame,
+) -> str:
+    """Build a figure and return its JSON; memoized so layout-only tweaks skip the rebuild.
+
+    ``(dataset_name, dataset_token, parsed_at, shape)`` identifies the data:
+    the file handler's token changes whenever the dataset is replaced, even
+    by a file with the same name and shape, and ``parsed_at`` whenever the
+    time column is re-parsed.
+    Large line/scatter/area inputs are downsampled by the builders, so only
+    the reduced figure is cached.  The cache holds the JSON string rather
+    than the Figure, so a hit skips unpickling and re-validating traces.
+    """
+    return pg.create_plot(kind, _df, time_column, list(variables), dict(trace_config)).to_json()
+
+
+def _load_figure(fig_json: str):
+    """Figure from :func:`_build_chart` output, without re-validating it."""
+    import plotly.graph_objects as go  # deferred: heavy import
+    import plotly.io as pio
+
+    return go.Figure(pio.json.from_json_plotly(fig_json), _validate=False)
+
+
 # -----------------------------------------------------------------------------
 # Page UI
 # -----------------------------------------------------------------------------
@@ -36,11 +101,25 @@ if not selected_dataset:
     st.stop()
 
 dataset_info = st.session_state.parsed_datasets[selected_dataset]
-df: pd.DataFrame = dataset_info["data"]
 time_column: str = dataset_info["time_column"]
+source_df = fh.get_dataset(dataset_info["data_name"])
+if source_df is None:
+    st.error("❌ Dataset no longer loaded. Please upload it and set up its time column again.")
+    st.stop()
+if dataset_info.get("source_token") != fh.get_dataset_token(dataset_info["data_name"]):
+    # Re-uploaded since parsing: the stored time column belongs to the old data
+    st.warning("⚠️ This dataset was replaced after its time column was parsed. Please parse it again.")
+    st.stop()
+
+# Shallow copy shares every column array with the stored dataset; only the
+# parsed time column is added on top.
+df: pd.DataFrame = source_df.copy(deep=False)
+df[time_column] = dataset_info["parsed_series"]
 
 # Variable selection – only numeric cols (excluding time col)
-numeric_columns: List[str] = df.select_dtypes(include=[np.number]).columns.tolist()
+numeric_columns: List[str] = _numeric_cols(
+    selected_dataset, tuple(df.columns), tuple(str(t) for t in df.dtypes)
+)
 if time_column in numeric_columns:
     numeric_columns.remove(time_column)
 
@@ -65,7 +144,7 @@ with col1:
 
 with col2:
     st.markdown("**Quick Settings:**")
-    color_palette = st.selectbox("Color palette:", options=list(pg.COLOR_PALETTES.keys()))
+    color_palette = st.selectbox("Color palette:", options=list(pg.get_color_palettes().keys()))
     show_markers = st.checkbox("Show markers", value=True)
     show_grid = st.checkbox("Show grid", value=True)
     width = st.slider("Width", 400, 1200, 800, 50)
@@ -73,31 +152,38 @@ with col2:
 
 # Generate plot if variables selected
 if selected_variables:
-    config: Dict[str, Any] = {
+    # Only these options change the traces; width/height/grid are applied to
+    # the cached figure below without rebuilding it.
+    trace_config: Dict[str, Any] = {
         "title": f"{', '.join(selected_variables)} Over Time",
-        "width": width,
-        "height": height,
         "color_palette": color_palette,
         "show_markers": show_markers,
-        "show_grid": show_grid,
     }
 
     try:
-        if chart_type == "Line Chart":
-            fig = pg.create_line_chart(df, time_column, selected_variables, config)
-        elif chart_type == "Scatter Plot":
-            fig = pg.create_scatter_plot(df, time_column, selected_variables, config)
-        elif chart_type == "Area Chart":
-            fig = pg.create_area_chart(df, time_column, selected_variables, config)
-        elif chart_type == "Bar Chart":
-            fig = pg.create_bar_chart(df, time_column, selected_variables, config)
-        elif chart_type == "Box Plot":
-            fig = pg.create_box_plot(df, time_column, selected_variables, config)
-        else:
-            st.error("Unsupported chart type")
-            st.stop()
+        fig = _load_figure(
+            _build_chart(
+                _CHART_KINDS[chart_type],
+                selected_dataset,
+                fh.get_dataset_token(dataset_info["data_name"]),
+                dataset_info.get("parsed_at"),
+                df.shape,
+                time_column,
+                tuple(selected_variables),
+                tuple(sorted(trace_config.items())),
+                df,
+            )
+        )
+        fig.update_layout(width=width, height=height)
+        fig.update_xaxes(showgrid=show_grid)
+        fig.update_yaxes(showgrid=show_grid)
 
         # Display
+        if _CHART_KINDS[chart_type] in _DOWNSAMPLED_KINDS and len(df) > config.DOWNSAMPLE_THRESHOLD:
+            st.caption(
+                f"Showing a shape-preserving sample of {len(df):,} rows "
+                f"(up to {config.DOWNSAMPLE_POINTS:,} points per variable)."
+            )
         st.plotly_chart(fig, use_container_width=True)
 
         # Export
@@ -106,7 +192,7 @@ if selected_variables:
         with ec1:
             if st.button("📊 Export PNG"):
                 try:
-                    img_bytes = fig.to_image(format="png", width=1200, height=800, scale=2)
+                    img_bytes = pg.BasePlotter.export_plot(fig, "png", width=1200, height=800, scale=2)
                     st.download_button(
                         "Download PNG",
                         data=img_bytes,
@@ -116,8 +202,13 @@ if selected_variables:
                 except Exception as e:
                     st.error(f"Export failed: {e}")
         with ec2:
+            self_contained = st.checkbox(
+                "Self-contained HTML",
+                value=False,
+                help="Embed Plotly.js (~3.5 MB) so the file also opens offline",
+            )
             if st.button("📊 Export HTML"):
-                html_bytes = fig.to_html(include_plotlyjs=True).encode()
+                html_bytes = pg.BasePlotter.export_plot(fig, "html", self_contained=self_contained)
                 st.download_button(
                     "Download HTML",
                     data=html_bytes,
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import streamlit as st
 
-from utils.session_init import ensure_session_state
+from utils.file_handler import clear_parse_cache, release_memory
+from utils.session_init import ensure_session_state, forget_dataset_state
 
 ensure_session_state()
 
@@ -19,7 +20,9 @@ c1, c2 = st.columns(2)
 with c1:
     if st.button("🗑️ Clear All Datasets"):
         fh.clear_all_datasets()
-        st.session_state.parsed_datasets.clear()
+        forget_dataset_state()
+        clear_parse_cache()
+        release_memory()
         st.success("✅ All datasets cleared!")
         st.rerun()
 
@@ -28,5 +31,7 @@ with c2:
         for key in list(st.session_state.keys()):
             if key not in ["file_handler", "datetime_parser", "plot_generator"]:
                 del st.session_state[key]
+        clear_parse_cache()
+        release_memory()
         st.success("✅ Application reset!")
         st.rerun()
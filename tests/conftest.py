@@ -0,0 +1,6 @@
+"""Make the app's top-level modules (``config``, ``utils``) importable."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
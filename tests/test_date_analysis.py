@@ -0,0 +1,62 @@
+"""Tests for utils.date_analysis and the date pre-filter it relies on."""
+
+import pandas as pd
+import pytest
+import streamlit as st
+
+from utils import date_analysis
+from utils.datetime.core import DateTimeParser
+
+
+@pytest.fixture
+def parser():
+    parser = DateTimeParser()
+    st.session_state.datetime_parser = parser
+    date_analysis._detect_cached.clear()
+    yield parser
+    del st.session_state.datetime_parser
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "when": [f"2021-03-{day:02d}" for day in range(1, 29)],
+            "label": [f"item {i}" for i in range(28)],
+            "value": [-0.5 * i for i in range(28)],
+        }
+    )
+
+
+def test_detects_date_column(parser, frame):
+    candidates = date_analysis.detect_datetime_columns_cached(frame)
+    assert [c["column"] for c in candidates] == ["when"]
+
+
+def test_results_follow_content(parser, frame):
+    first = date_analysis.detect_datetime_columns_cached(frame)
+    assert date_analysis.detect_datetime_columns_cached(frame.copy()) == first
+
+    changed = frame.assign(when=[f"row {i}" for i in range(28)])
+    assert date_analysis.detect_datetime_columns_cached(changed) == []
+
+
+def test_fingerprint_changes_with_values(parser, frame):
+    key = date_analysis._fingerprint(frame, 1_000)
+    assert key == date_analysis._fingerprint(frame.copy(), 1_000)
+    assert key != date_analysis._fingerprint(frame.assign(value=-1), 1_000)
+
+
+@pytest.mark.parametrize("value", ["1/2/20", "2020-01", "12.03.2020", "March 3, 2020"])
+def test_prefilter_accepts_unpatterned_dates(value):
+    assert DateTimeParser()._may_contain_dates(pd.Series([value] * 3))
+
+
+def test_prefilter_looks_past_leading_placeholders():
+    junk = ["Date", "N/A", "-", "unknown", "TBD"]
+    dates = [f"2020-01-{day:02d}" for day in range(1, 29)] * 3
+    assert DateTimeParser()._may_contain_dates(pd.Series(junk + dates))
+
+
+def test_prefilter_rejects_text():
+    assert not DateTimeParser()._may_contain_dates(pd.Series(["hello world", "A12345"] * 5))
@@ -0,0 +1,65 @@
+"""Tests for utils.plot.downsample (LTTB)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.plot import downsample
+from utils.plot.downsample import downsample_frame, lttb_indices
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype=np.float64)
+    y = rng.normal(size=x.size).cumsum()
+    y[3_217] = 500.0  # isolated spike
+    y[7_001] = -500.0  # isolated dip
+    return x, y
+
+
+def test_keeps_endpoints_and_extremes(series):
+    x, y = series
+    picked = lttb_indices(x, y, 200)
+    assert len(picked) == 200
+    assert picked[0] == 0 and picked[-1] == x.size - 1
+    assert np.all(np.diff(picked) > 0)
+    assert y.argmax() in picked
+    assert y.argmin() in picked
+
+
+def test_short_input_is_returned_whole():
+    x = np.arange(5, dtype=np.float64)
+    assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_loop_matches_numpy(series):
+    x, y = series
+    n_out = 300
+    edges = np.linspace(1, x.size - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, x.size - 1
+    downsample._lttb_loop(x, y, edges, selected)
+    np.testing.assert_array_equal(selected, downsample._lttb_numpy(x, y, n_out))
+
+
+@pytest.mark.skipif(downsample._lttb_jit is None, reason="numba not installed")
+def test_compiled_matches_numpy(series):
+    x, y = series
+    np.testing.assert_array_equal(
+        downsample._lttb_compiled(x, y, 300), downsample._lttb_numpy(x, y, 300)
+    )
+
+
+def test_downsample_frame_orders_rows_and_skips_nan(series):
+    x, y = series
+    y = y.copy()
+    y[10] = np.nan
+    df = pd.DataFrame(
+        {"t": pd.date_range("2020-01-01", periods=x.size, freq="min"), "v": y}
+    ).iloc[::-1]
+    out = downsample_frame(df, "t", ["v"], 100)
+    assert len(out) == 100
+    assert out["t"].is_monotonic_increasing
+    assert out["v"].notna().all()
+    assert out["t"].iloc[0] == df["t"].min() and out["t"].iloc[-1] == df["t"].max()
@@ -0,0 +1,128 @@
+"""Tests for utils.file_handler reader paths."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from utils.file_handler import FileHandler
+
+
+def _upload(data: bytes, name: str = "data.csv") -> io.BytesIO:
+    """A BytesIO shaped like a Streamlit upload."""
+    buffer = io.BytesIO(data)
+    buffer.name = name
+    buffer.size = len(data)
+    return buffer
+
+
+@pytest.fixture
+def fh():
+    return FileHandler()
+
+
+def test_duplicate_headers_renamed_like_pandas(fh):
+    data = b"a,a,b,a\n1,2,x,3\n4,5,y,6\n"
+    df, error = fh.read_file(_upload(data))
+    assert error == ""
+    assert list(df.columns) == list(pd.read_csv(io.BytesIO(data)).columns)
+    assert list(df.columns) == ["a", "a.1", "b", "a.2"]
+    assert isinstance(df["a"], pd.Series)
+
+
+def test_blank_headers_named_unnamed(fh):
+    data = b",b,\n1,2,3\n4,5,6\n"
+    df, error = fh.read_file(_upload(data))
+    assert error == ""
+    assert list(df.columns) == ["Unnamed: 0", "b", "Unnamed: 2"]
+
+
+def test_duplicate_headers_survive_add_dataset(fh):
+    df, _ = fh.read_file(_upload(b"a,a\nx,y\nx,z\n"))
+    fh.add_dataset("dup", df, {})
+    assert fh.get_dataset_stats("dup")["columns"] == 2
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        ["a", "a.1", "a"],
+        ["a", "a", "a.1", "a"],
+        ["", "b", "b", "", "b.1"],
+    ],
+)
+def test_column_names_match_c_engine(names):
+    data = (",".join(names) + "\n" + ",".join("1" * len(names)) + "\n").encode()
+    expected = list(pd.read_csv(io.BytesIO(data), engine="c").columns)
+    assert FileHandler._pandas_column_names(names) == expected
+
+
+@pytest.mark.parametrize("dtype_backend", [None, "pyarrow"])
+def test_iso_dates_load_as_datetime(fh, dtype_backend):
+    data = b"day,value\n2020-01-01,1\n2020-01-02,2\n"
+    df, error = fh.read_file(_upload(data), dtype_backend)
+    assert error == ""
+    assert pd.api.types.is_datetime64_any_dtype(df["day"])
+    fh.add_dataset("dates", df, {})
+    stats = fh.get_dataset_stats("dates")
+    assert stats["datetime_columns"] == 1
+    assert stats["text_columns"] == 0
+
+
+def test_non_utf8_csv_falls_back_to_legacy_encoding(fh):
+    # ASCII for well past the sniffed head, then a cp1252-only byte
+    rows = b"".join(b"r%d,%d\n" % (i, i) for i in range(FileHandler.ENCODING_SNIFF_BYTES // 6))
+    data = b"name,value\n" + rows + "café,1\n".encode("cp1252")
+    df, error = fh.read_file(_upload(data))
+    assert error == ""
+    assert df["name"].iloc[-1] == "café"
+    assert not fh._has_bytes_columns(df)
+
+
+def test_ragged_csv_falls_back_to_pandas(fh):
+    # Arrow rejects short rows; pandas pads them with missing values
+    data = b"a,b\n1,2\n3\n"
+    assert fh._read_delimited_arrow(_upload(data), ",", None) == (None, False)
+    df, error = fh.read_file(_upload(data))
+    assert error == ""
+    assert df["a"].tolist() == [1, 3]
+    assert df["b"].isna().tolist() == [False, True]
+
+
+def test_tsv(fh):
+    df, error = fh.read_file(_upload(b"a\tb\n1\tx\n2\ty\n", "data.tsv"))
+    assert error == ""
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"a": 1, "b": "x"}\n{"a": 2, "b": "y"}\n',
+        b'[{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]',
+        b'{"data": [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]}',
+    ],
+    ids=["ndjson", "array", "data-wrapper"],
+)
+def test_json_layouts(fh, data):
+    df, error = fh.read_file(_upload(data, "data.json"))
+    assert error == ""
+    assert df["a"].tolist() == [1, 2]
+    assert df["b"].tolist() == ["x", "y"]
+
+
+def test_single_json_object_is_one_row(fh):
+    df, error = fh.read_file(_upload(b'{"a": 1, "b": "x"}', "data.json"))
+    assert error == ""
+    assert len(df) == 1
+
+
+def test_chunked_reader_rejects_chunks_with_conflicting_dtypes(fh, monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    rows = b"".join(b"%d,1\n" % i for i in range(1000))
+    data = b"a,b\n" + rows + b"text,1\n"
+    assert fh._read_delimited_chunked(_upload(data), ",", "utf-8", {}) is None
+    df = fh._read_delimited_chunked(_upload(b"a,b\n" + rows), ",", "utf-8", {})
+    assert len(df) == 1000
+    assert pd.api.types.is_integer_dtype(df["a"])
@@ -0,0 +1,68 @@
+"""Tests for utils.plot.trend and scatter trend lines."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.plot import create_plot, trend
+from utils.plot.trend import linreg_predict
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(1)
+    # Epoch-nanosecond x values stress the centring
+    x = pd.date_range("2020-01-01", periods=5_000, freq="h").asi8.astype(np.float64)
+    y = 3e-12 * x + rng.normal(size=x.size)
+    valid = np.ones(x.size, dtype=bool)
+    valid[::7] = False
+    y[::11] = np.nan
+    return x, y, valid
+
+
+def _loop_fit(x, y, valid):
+    out = np.empty(x.size)
+    return out if trend._linreg_loop(x, y, valid, out) else None
+
+
+def test_loop_matches_numpy(points):
+    np.testing.assert_allclose(_loop_fit(*points), trend._linreg_numpy(*points), rtol=1e-9)
+
+
+@pytest.mark.skipif(trend._linreg_jit is None, reason="numba not installed")
+def test_compiled_matches_numpy(points):
+    x, y, valid = points
+    out = np.empty(x.size)
+    assert trend._linreg_jit(x, y, valid, out)
+    np.testing.assert_allclose(out, trend._linreg_numpy(x, y, valid), rtol=1e-9)
+
+
+def test_matches_polyfit(points):
+    x, y, valid = points
+    mask = valid & np.isfinite(y)
+    slope, intercept = np.polyfit(x[mask], y[mask], 1)
+    np.testing.assert_allclose(linreg_predict(x, y, valid), slope * x + intercept, rtol=1e-6)
+
+
+@pytest.mark.parametrize("fit", [trend._linreg_numpy, _loop_fit])
+def test_degenerate_input_gives_no_line(fit):
+    valid = np.ones(3, dtype=bool)
+    assert fit(np.array([1.0, 1.0, 1.0]), np.array([1.0, 2.0, 3.0]), valid) is None
+    assert fit(np.array([1.0, 2.0, 3.0]), np.array([1.0, np.nan, np.nan]), valid) is None
+
+
+def test_scatter_trend_ignores_downsampling():
+    rng = np.random.default_rng(2)
+    n = 20_000
+    df = pd.DataFrame(
+        {
+            "t": pd.date_range("2020-01-01", periods=n, freq="min"),
+            "v": np.arange(n) * 0.01 + rng.normal(0, 5, n) ** 3,
+        }
+    )
+    cfg = {"show_trendline": True, "downsample_threshold": 1_000, "downsample_points": 500}
+    full = create_plot("scatter", df, "t", ["v"], {**cfg, "downsample": False})
+    reduced = create_plot("scatter", df, "t", ["v"], cfg)
+    assert len(reduced.data[0].x) < len(full.data[0].x)
+    np.testing.assert_allclose(reduced.data[1].y, full.data[1].y)
+    assert len(full.data[1].x) == 2
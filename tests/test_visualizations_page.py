@@ -0,0 +1,59 @@
+"""Chart caching on the Create Visualizations page."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from utils.file_handler import FileHandler
+from utils.session_init import _datetime_parser
+
+PAGE = str(Path(__file__).resolve().parent.parent / "pages" / "3_Create_Visualizations.py")
+
+
+def _parse(at: AppTest, fh: FileHandler, name: str) -> None:
+    """Record a parsed time column the way the Time Column Setup page does."""
+    parsed, _ = _datetime_parser().parse_datetime_column(fh.get_dataset(name)["t"])
+    at.session_state["parsed_datasets"] = {
+        name: {
+            "data_name": name,
+            "parsed_series": parsed,
+            "time_column": "t_parsed",
+            "original_time_column": "t",
+            "parsed_at": datetime(2020, 1, 1),
+            "source_token": fh.get_dataset_token(name),
+        }
+    }
+
+
+def _chart_spec(at: AppTest) -> str:
+    charts = at.get("plotly_chart")
+    assert charts, [e.value for e in at.error]
+    return charts[0].proto.spec
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {"t": pd.date_range("2020-01-01", periods=50, freq="D").astype(str), "Temperature": range(50)}
+    )
+
+
+def test_replaced_dataset_is_not_served_from_cache(frame):
+    fh = FileHandler()
+    fh.add_dataset("d", frame, {})
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.session_state["file_handler"] = fh
+    _parse(at, fh, "d")
+    first = _chart_spec(at.run())
+
+    # Same name, shape and parse time; only the values differ
+    fh.add_dataset("d", frame.assign(Temperature=-999), {})
+    at.run()
+    assert not at.get("plotly_chart")
+    assert "parse it again" in at.warning[0].value
+
+    _parse(at, fh, "d")
+    assert _chart_spec(at.run()) != first
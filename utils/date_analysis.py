@@ -0,0 +1,83 @@
+"""Date-column analysis shared by the Data Upload and Time Column Setup pages.
+
+Detection scans every column with regex and parsing heuristics, so results
+are memoized per dataset: clicking *Analyze Dates* on the upload page and
+then *Auto-Detect* on the setup page only pays for the scan once.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+import streamlit as st
+
+import config
+
+__all__ = ["detect_datetime_columns_cached", "analyze_datetime_columns"]
+
+
+def _fingerprint(df: pd.DataFrame, sample_size: int) -> Tuple[Any, ...]:
+    """Cheap key covering everything detection reads from *df*.
+
+    Detection only looks at the dtypes and the sampled rows, so those (plus
+    the row count) identify its result without hashing the whole frame.
+    """
+    sample = st.session_state.datetime_parser.sample_rows(df, sample_size)
+    try:
+        content = pd.util.hash_pandas_object(sample, index=False)
+    except TypeError:  # unhashable cells such as lists from JSON
+        content = pd.util.hash_pandas_object(sample.astype(str), index=False)
+    return (
+        df.shape,
+        tuple((str(col), str(dtype)) for col, dtype in df.dtypes.items()),
+        int(content.to_numpy().sum(dtype="uint64")),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _detect_cached(
+    fingerprint: Tuple[Any, ...],
+    sample_size: int,
+    _parser: Any,
+    _df: pd.DataFrame,
+) -> List[Dict[str, Any]]:
+    """Run detection; *fingerprint* changes whenever the result could."""
+    return _parser.detect_datetime_columns(_df, sample_size=sample_size)
+
+
+def detect_datetime_columns_cached(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Return datetime candidates for *df*, reusing earlier results.
+
+    Only ``config.DETECTION_SAMPLE_SIZE`` sampled rows are inspected, so
+    the cost does not grow with the dataset length.  Results are shared by
+    every rerun (and every dataset) with the same schema and sample rows.
+    """
+    sample_size = config.DETECTION_SAMPLE_SIZE
+    return _detect_cached(
+        _fingerprint(df, sample_size),
+        sample_size,
+        st.session_state.datetime_parser,
+        df,
+    )
+
+
+def analyze_datetime_columns(dataset_name: str) -> None:
+    """Detect datetime columns of a loaded dataset and summarise them inline.
+
+    The candidates are also stored where the Time Column Setup page looks for
+    them, so that page opens with the detection already done.
+    """
+    df = st.session_state.file_handler.get_dataset(dataset_name)
+    if df is None:
+        st.error("Dataset not found")
+        return
+
+    candidates = detect_datetime_columns_cached(df)
+    st.session_state[f"datetime_candidates_{dataset_name}"] = candidates
+
+    if not candidates:
+        st.info("No date/time columns detected")
+        return
+    for candidate in candidates:
+        st.write(f"🕐 **{candidate['column']}** ({candidate['confidence']:.2f})")
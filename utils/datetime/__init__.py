@@ -46,7 +46,9 @@ def detect_and_parse(
 
     candidates = detector.detect(df)
     report: Dict[str, Dict] = {}
-    new_df = df.copy()
+    # Shallow copy: only the parsed columns are replaced, every other column
+    # stays shared with *df*
+    new_df = df.copy(deep=False)
 
     for cand in candidates:
         col = cand["column"]
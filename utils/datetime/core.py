@@ -6,66 +6,159 @@ here, allowing us to remove the legacy ``utils/data_parser.py``.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import warnings
 
 import numpy as np
 import pandas as pd
-from dateutil import parser as date_parser
 import pytz
 
 import config
 
 __all__ = ["DateTimeParser"]
 
+# Largest epoch values (2038-01-19) accepted as Unix timestamps
+_UNIX_SECONDS_MAX = 2147483647
+_UNIX_MILLIS_MAX = _UNIX_SECONDS_MAX * 1000
+
+# Tick sizes for the validation frequency hint
+_NS_PER_UNIT = {"s": 10**9, "ms": 10**6, "us": 10**3, "ns": 1}
+_MINUTE_NS = 60 * 10**9
+_HOUR_NS = 60 * _MINUTE_NS
+_DAY_NS = 24 * _HOUR_NS
+
+# English month names/abbreviations, for dates written out in words
+_MONTH_NAME_RE = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\b", re.IGNORECASE
+)
+
+# Date-like fragment embedded in free text, used by the regex fallback
+_DATE_EXTRACT_RE = re.compile(r"(\d{1,4}[-/]\d{1,2}[-/]\d{1,4})")
+
+
+@contextmanager
+def _quiet_mixed_parsing() -> Iterator[None]:
+    """Silence pandas' dayfirst inference warnings, expected for DD/MM data.
+
+    The warnings filter list is process-global and ``catch_warnings`` is not
+    thread-safe, so enter this once on the calling thread -- around any
+    thread pool -- rather than inside per-column workers.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        yield
+
 
 class DateTimeParser:
     """Handles detection, parsing and validation of date/time columns."""
 
     DATE_PATTERNS = config.DATE_PATTERNS  # type: ignore[attr-defined]
+    DATE_PATTERN_RE = config.DATE_PATTERN_RE  # type: ignore[attr-defined]
+    DATE_PATTERN_GROUPS = config.DATE_PATTERN_GROUPS  # type: ignore[attr-defined]
+
+    # Non-null values each candidate format is probed on before the full parse
+    FORMAT_PROBE_SIZE = 1000
     DATETIME_FORMATS = config.DATETIME_FORMATS  # type: ignore[attr-defined]
 
+    # Threads used to analyse columns concurrently during detection
+    DETECTION_WORKERS = 8
+
+    # Most frequent distinct values per column considered by the text analysis
+    MAX_DISTINCT_VALUES = 50
+
     def __init__(self):
         self.timezone = pytz.UTC
 
     # ------------------------------------------------------------------
     # Detection helpers
     # ------------------------------------------------------------------
-    def detect_datetime_columns(self, df: pd.DataFrame, sample_size: int = 100) -> List[Dict[str, Any]]:
-        datetime_candidates: List[Dict[str, Any]] = []
-        sample_df = df.head(sample_size) if len(df) > sample_size else df
-
-        for column in df.columns:
-            if df[column].dtype == "object" or pd.api.types.is_string_dtype(df[column]):
-                confidence, fmt_hint = self._analyze_column_for_datetime(sample_df[column].dropna())
-                if confidence > 0.3:
-                    datetime_candidates.append(
-                        {
-                            "column": column,
-                            "confidence": confidence,
-                            "format_hint": fmt_hint,
-                            "sample_values": sample_df[column].dropna().head(3).tolist(),
-                        }
-                    )
-            elif pd.api.types.is_numeric_dtype(df[column]):
-                confidence, fmt_hint = self._check_unix_timestamp(sample_df[column].dropna())
-                if confidence > 0.5:
-                    datetime_candidates.append(
-                        {
-                            "column": column,
-                            "confidence": confidence,
-                            "format_hint": fmt_hint,
-                            "sample_values": sample_df[column].dropna().head(3).tolist(),
-                        }
+    def detect_datetime_columns(
+        self, df: pd.DataFrame, sample_size: int = config.DETECTION_SAMPLE_SIZE
+    ) -> List[Dict[str, Any]]:
+        sample_df = self.sample_rows(df, sample_size)
+
+        # Columns are independent and most of the work (regex, to_datetime)
+        # runs in C, so they are analysed concurrently; map() keeps column
+        # order for equal-confidence ties.
+        columns = list(df.columns)
+        with _quiet_mixed_parsing():
+            if len(columns) > 1:
+                with ThreadPoolExecutor(max_workers=min(self.DETECTION_WORKERS, len(columns))) as executor:
+                    results = list(
+                        executor.map(lambda col: self._analyze_or_timestamp(col, df[col], sample_df[col]), columns)
                     )
+            else:
+                results = [self._analyze_or_timestamp(col, df[col], sample_df[col]) for col in columns]
+        datetime_candidates = [candidate for candidate in results if candidate is not None]
 
         datetime_candidates.sort(key=lambda x: x["confidence"], reverse=True)
         return datetime_candidates
 
+    @staticmethod
+    def sample_rows(df: pd.DataFrame, sample_size: int) -> pd.DataFrame:
+        """Rows detection looks at: a reproducible random sample, in row order.
+
+        Spreading the sample over the whole frame avoids judging a column by
+        an unrepresentative (e.g. empty) leading block.
+        """
+        if len(df) <= sample_size:
+            return df
+        rng = np.random.default_rng(0)
+        positions = np.sort(rng.choice(len(df), size=sample_size, replace=False))
+        return df.iloc[positions]
+
     # ------------------------------------------------------------------
     # Internal analysis helpers
     # ------------------------------------------------------------------
+    def _analyze_or_timestamp(
+        self, column: Any, series: pd.Series, sample: pd.Series
+    ) -> Optional[Dict[str, Any]]:
+        """Detection report for one column, or None if it is not date-like."""
+        sample = sample.dropna()
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Arrow readers already infer ISO dates/timestamps natively
+            confidence, fmt_hint = 1.0, "Native datetime"
+        elif series.dtype == "object" or pd.api.types.is_string_dtype(series):
+            if not self._may_contain_dates(sample):
+                return None
+            confidence, fmt_hint = self._analyze_column_for_datetime(sample)
+            if confidence <= 0.3:
+                return None
+        elif pd.api.types.is_numeric_dtype(series):
+            confidence, fmt_hint = self._check_unix_timestamp(sample)
+            if confidence <= 0.5:
+                return None
+        else:
+            return None
+        return {
+            "column": column,
+            "confidence": confidence,
+            "format_hint": fmt_hint,
+            "sample_values": sample.head(3).tolist(),
+        }
+
+    def _may_contain_dates(self, series: pd.Series, probe: int = 5) -> bool:
+        """Cheap reject for free text, IDs, e-mails and the like.
+
+        Looks at the *probe* most frequent values, so a few leading headers
+        or placeholders cannot decide the column: at least one must have a
+        plausible date length and either contain a DATE_PATTERN or a month
+        name, or else parse as a date (``1/2/20``, ``2020-01``, ``12.03.2020``
+        match no pattern).  Columns failing this skip the full analysis.
+        """
+        values = series.astype(str).str.strip().value_counts().index[:probe]
+        candidates = [value for value in values if 6 <= len(value) <= 40]
+        for value in candidates:
+            if self.DATE_PATTERN_RE.search(value) or _MONTH_NAME_RE.search(value):
+                return True
+        if not candidates:
+            return False
+        return bool(self._to_datetime_mixed(pd.Series(candidates, dtype=object)).notna().any())
+
     def _analyze_column_for_datetime(self, series: pd.Series) -> Tuple[float, str]:
         if len(series) == 0:
             return 0.0, "No data"
@@ -74,19 +167,25 @@ class DateTimeParser:
         parsed_cnt = 0
         format_matches: Dict[str, int] = {}
 
-        for val in series:
-            if pd.isna(val):
-                continue
-            str_val = str(val).strip()
-            for pattern in self.DATE_PATTERNS:
-                if re.match(pattern, str_val):
-                    format_matches[pattern] = format_matches.get(pattern, 0) + 1
-                    break
-            try:
-                date_parser.parse(str_val)
-                parsed_cnt += 1
-            except (ValueError, TypeError, OverflowError):
-                pass
+        # Real columns repeat the same date strings a lot: match and parse
+        # each distinct value once and weight it by its count.
+        counts = series.dropna().astype(str).str.strip().value_counts()
+        if len(counts) > self.MAX_DISTINCT_VALUES:
+            # Judge the column on its most common values only
+            total -= int(counts.iloc[self.MAX_DISTINCT_VALUES:].sum())
+            counts = counts.iloc[: self.MAX_DISTINCT_VALUES]
+        for str_val, cnt in counts.items():
+            # One scan of the union regex; the matching alternative's group
+            # name identifies the first pattern that fits
+            match = self.DATE_PATTERN_RE.match(str_val)
+            if match:
+                pattern = self.DATE_PATTERN_GROUPS[match.lastgroup]
+                format_matches[pattern] = format_matches.get(pattern, 0) + cnt
+
+        # Parse all distinct values in one vectorised call instead of one
+        # dateutil.parse per value
+        parsed = self._to_datetime_mixed(counts.index.to_series())
+        parsed_cnt = int(counts.to_numpy()[parsed.notna().to_numpy()].sum())
 
         confidence = parsed_cnt / total if total else 0
         if format_matches:
@@ -96,43 +195,71 @@ class DateTimeParser:
             fmt_hint = "Mixed or custom format"
         return confidence, fmt_hint
 
+    @staticmethod
+    def _to_datetime_mixed(values: pd.Series) -> pd.Series:
+        """Parse strings of any (per-value) format, NaT where unparseable.
+
+        Callers wrap this in :func:`_quiet_mixed_parsing`.
+        """
+        try:
+            return pd.to_datetime(values, errors="coerce", format="mixed", cache=True)
+        except ValueError:
+            # Offsets differ between values; compare them in UTC
+            return pd.to_datetime(values, errors="coerce", format="mixed", utc=True, cache=True)
+
     def _check_unix_timestamp(self, series: pd.Series) -> Tuple[float, str]:
         if len(series) == 0:
             return 0.0, "No data"
-        min_val, max_val = series.min(), series.max()
-        ranges = [
-            (0, 2147483647, "Unix timestamp (seconds)"),
-            (0, 2147483647000, "Unix timestamp (milliseconds)"),
-            (315532800, 4102444800, "Unix timestamp (seconds, 1980-2100)"),
-        ]
-        confidence = 0.0
-        fmt_hint = "Not a timestamp"
-        for lo, hi, hint in ranges:
-            if lo <= min_val <= hi and lo <= max_val <= hi:
-                try:
-                    test_date = (
-                        pd.to_datetime(series.iloc[0], unit="ms") if max_val > 2147483647 else pd.to_datetime(series.iloc[0], unit="s")
-                    )
-                    if pd.Timestamp("1970-01-01") <= test_date <= pd.Timestamp("2050-01-01"):
-                        confidence = 0.8
-                        fmt_hint = hint
-                        break
-                except Exception:  # pylint: disable=broad-except
-                    continue
-        return confidence, fmt_hint
+        if pd.api.types.is_bool_dtype(series):
+            return 0.0, "Not a timestamp"
+        # Plain scalar bounds: every non-negative value up to 2**31 - 1 is a
+        # 1970-2038 epoch second, and up to that * 1000 an epoch millisecond,
+        # so no Timestamp needs to be built to confirm it.
+        # Detection passes at most DETECTION_SAMPLE_SIZE values, so two NumPy
+        # reductions on one converted buffer beat any JIT warm-up.
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        min_val, max_val = values.min(), values.max()
+        if min_val < 0:
+            return 0.0, "Not a timestamp"
+        if max_val <= _UNIX_SECONDS_MAX:
+            return 0.8, "Unix timestamp (seconds)"
+        if max_val <= _UNIX_MILLIS_MAX:
+            return 0.8, "Unix timestamp (milliseconds)"
+        return 0.0, "Not a timestamp"
 
-    @staticmethod
-    def _pattern_to_format_hint(pattern: str) -> str:
-        mapping = {
-            r"\d{4}-\d{2}-\d{2}": "YYYY-MM-DD",
-            r"\d{2}/\d{2}/\d{4}": "MM/DD/YYYY or DD/MM/YYYY",
-            r"\d{2}-\d{2}-\d{4}": "MM-DD-YYYY or DD-MM-YYYY",
-            r"\d{1,2}/\d{1,2}/\d{4}": "M/D/YYYY",
-            r"\d{1,2}-\d{1,2}-\d{4}": "M-D-YYYY",
-            r"\d{4}/\d{2}/\d{2}": "YYYY/MM/DD",
-            r"\d{4}\d{2}\d{2}": "YYYYMMDD",
-        }
-        return mapping.get(pattern, "Custom format")
+    # strftime format tried first for values fully matching a DATE_PATTERN.
+    # Ambiguous day/month patterns map to the month-first format, which is
+    # also what the DATETIME_FORMATS loop tries first.
+    _PATTERN_FORMATS = {
+        r"\d{4}-\d{2}-\d{2}": "%Y-%m-%d",
+        r"\d{2}/\d{2}/\d{4}": "%m/%d/%Y",
+        r"\d{2}-\d{2}-\d{4}": "%m-%d-%Y",
+        r"\d{1,2}/\d{1,2}/\d{4}": "%m/%d/%Y",
+        r"\d{1,2}-\d{1,2}-\d{4}": "%m-%d-%Y",
+        r"\d{4}/\d{2}/\d{2}": "%Y/%m/%d",
+        r"\d{4}\d{2}\d{2}": "%Y%m%d",
+    }
+
+    def _infer_format(self, sample: Any) -> Optional[str]:
+        """strftime format of *sample* if it is exactly one DATE_PATTERN."""
+        match = self.DATE_PATTERN_RE.fullmatch(str(sample).strip())
+        if match is None:
+            return None
+        return self._PATTERN_FORMATS.get(self.DATE_PATTERN_GROUPS[match.lastgroup])
+
+    _PATTERN_HINTS = {
+        r"\d{4}-\d{2}-\d{2}": "YYYY-MM-DD",
+        r"\d{2}/\d{2}/\d{4}": "MM/DD/YYYY or DD/MM/YYYY",
+        r"\d{2}-\d{2}-\d{4}": "MM-DD-YYYY or DD-MM-YYYY",
+        r"\d{1,2}/\d{1,2}/\d{4}": "M/D/YYYY",
+        r"\d{1,2}-\d{1,2}-\d{4}": "M-D-YYYY",
+        r"\d{4}/\d{2}/\d{2}": "YYYY/MM/DD",
+        r"\d{4}\d{2}\d{2}": "YYYYMMDD",
+    }
+
+    @classmethod
+    def _pattern_to_format_hint(cls, pattern: str) -> str:
+        return cls._PATTERN_HINTS.get(pattern, "Custom format")
 
     # ------------------------------------------------------------------
     # Parsing
@@ -144,9 +271,14 @@ class DateTimeParser:
         custom_format: Optional[str] = None,
     ) -> Tuple[pd.Series, List[str]]:
         errors: List[str] = []
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Already parsed upstream (e.g. Arrow timestamp columns); only
+            # normalise Arrow-backed values to NumPy datetime64
+            return pd.to_datetime(series), errors
+
         if custom_format:
             try:
-                parsed = pd.to_datetime(series, format=custom_format, errors="coerce")
+                parsed = pd.to_datetime(series, format=custom_format, errors="coerce", cache=True)
                 if not parsed.isna().all():
                     return parsed, errors
                 errors.append(f"Custom format '{custom_format}' failed to parse any values")
@@ -156,15 +288,44 @@ class DateTimeParser:
         if format_hint and "timestamp" in str(format_hint).lower():
             try:
                 unit = "ms" if "milliseconds" in format_hint.lower() else "s"
-                parsed = pd.to_datetime(series, unit=unit, errors="coerce")
+                parsed = pd.to_datetime(series, unit=unit, errors="coerce", cache=True)
                 if not parsed.isna().all():
                     return parsed, errors
             except Exception as exc:  # pylint: disable=broad-except
                 errors.append(f"Timestamp parsing error: {exc}")
 
+        # ISO-8601 (with or without time/offset) goes through pandas' C fast
+        # path; only fall through to the explicit formats when it misses.
+        probe = series.dropna().head(self.FORMAT_PROBE_SIZE)
+        try:
+            if len(probe) and pd.to_datetime(probe, format="ISO8601", errors="coerce", cache=True).notna().mean() >= 0.5:
+                parsed = pd.to_datetime(series, format="ISO8601", errors="coerce", cache=True)
+                if parsed.notna().mean() >= 0.5:
+                    if parsed.dt.tz is not None:
+                        # Keep the naive (UTC wall-clock) values the format loop produced
+                        parsed = parsed.dt.tz_convert(None)
+                    return parsed, errors
+        except (ValueError, TypeError):
+            pass  # e.g. mixed UTC offsets
+
+        # A bare date in a known layout names its format directly: one parse
+        # instead of walking the format list.
+        if len(probe) and (
+            pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+        ):
+            fmt = self._infer_format(probe.iloc[0])
+            if fmt is not None:
+                parsed = pd.to_datetime(series, format=fmt, errors="coerce", cache=True)
+                if parsed.notna().mean() >= 0.5:
+                    return parsed, errors
+
+        # Probe each format on a small sample so failing formats cost O(probe)
+        # instead of a full pass; only a promising format parses the column.
         for fmt in self.DATETIME_FORMATS:
             try:
-                parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+                if len(probe) and pd.to_datetime(probe, format=fmt, errors="coerce", cache=True).notna().mean() < 0.5:
+                    continue
+                parsed = pd.to_datetime(series, format=fmt, errors="coerce", cache=True)
                 success_rate = (len(parsed) - parsed.isna().sum()) / len(parsed)
                 if success_rate >= 0.5:
                     return parsed, errors
@@ -172,9 +333,14 @@ class DateTimeParser:
                 continue
 
         try:
-            parsed = pd.to_datetime(series, errors="coerce", infer_datetime_format=True)
+            # Per-value format inference (ISO-8601 was already tried above);
+            # replaces the removed infer_datetime_format flag
+            with _quiet_mixed_parsing():
+                parsed = self._to_datetime_mixed(series)
             success_rate = (len(parsed) - parsed.isna().sum()) / len(parsed)
             if success_rate >= 0.3:
+                if parsed.dt.tz is not None:
+                    parsed = parsed.dt.tz_convert(None)
                 return parsed, errors
         except Exception as exc:  # pylint: disable=broad-except
             errors.append(f"Dateutil parsing error: {exc}")
@@ -189,24 +355,13 @@ class DateTimeParser:
         errors.append("Could not parse datetime column with any method")
         return pd.Series([pd.NaT] * len(series), index=series.index), errors
 
-    @staticmethod
-    def _extract_dates_with_regex(series: pd.Series) -> pd.Series:
-        date_pattern = re.compile(r"\d{1,4}[-/]\d{1,2}[-/]\d{1,4}")
-        extracted: List[pd.Timestamp | pd.NaT] = []
-        for val in series:
-            if pd.isna(val):
-                extracted.append(pd.NaT)
-                continue
-            match = date_pattern.search(str(val))
-            if match:
-                try:
-                    parsed_date = date_parser.parse(match.group())
-                    extracted.append(parsed_date)
-                except Exception:  # pylint: disable=broad-except
-                    extracted.append(pd.NaT)
-            else:
-                extracted.append(pd.NaT)
-        return pd.Series(extracted, index=series.index)
+    @classmethod
+    def _extract_dates_with_regex(cls, series: pd.Series) -> pd.Series:
+        # Pull the first date-like fragment out of each value and parse them
+        # all in one call; values without a fragment become NaT.
+        extracted = series.astype("string").str.extract(_DATE_EXTRACT_RE, expand=False)
+        with _quiet_mixed_parsing():
+            return cls._to_datetime_mixed(extracted)
 
     # ------------------------------------------------------------------
     # Validation
@@ -221,41 +376,53 @@ class DateTimeParser:
             "frequency_hint": None,
             "issues": [],
         }
-        result["missing_values"] = series.isna().sum()
+        # One missing-value mask serves both the counts and the selection
+        missing = series.isna().to_numpy()
+        result["missing_values"] = int(missing.sum())
         result["parsed_values"] = len(series) - result["missing_values"]
         if result["parsed_values"] == 0:
             result["is_valid"] = False
             result["issues"].append("No values could be parsed as datetime")
             return result
-        valid_dates = series.dropna()
-        if not valid_dates.empty:
-            result["date_range"] = {
-                "start": valid_dates.min(),
-                "end": valid_dates.max(),
-                "span_days": (valid_dates.max() - valid_dates.min()).days,
-            }
-        if len(valid_dates) > 2:
+        # Work on the raw integer ticks: one diff (plus a sort only when the
+        # column is out of order) yields the range and the gap histogram.
+        dates = pd.DatetimeIndex(series).array
+        unit, tz = dates.unit, dates.tz
+        ticks = dates.asi8[~missing] if result["missing_values"] else dates.asi8
+        diffs = np.diff(ticks)
+        if (diffs < 0).any():
+            ticks = np.sort(ticks)
+            diffs = np.diff(ticks)
+
+        def to_timestamp(tick: int) -> pd.Timestamp:
+            stamp = pd.Timestamp(np.datetime64(int(tick), unit))
+            return stamp.tz_localize("UTC").tz_convert(tz) if tz is not None else stamp
+
+        start, end = to_timestamp(ticks[0]), to_timestamp(ticks[-1])
+        result["date_range"] = {
+            "start": start,
+            "end": end,
+            "span_days": (end - start).days,
+        }
+        if ticks.size > 2:
             try:
-                sorted_dates = valid_dates.sort_values()
-                time_diffs = sorted_dates.diff().dropna()
-                mode_diff = time_diffs.mode()
-                if not mode_diff.empty:
-                    diff_days = mode_diff.iloc[0].days
-                    diff_seconds = mode_diff.iloc[0].total_seconds()
-                    if diff_days >= 365:
-                        result["frequency_hint"] = "Yearly"
-                    elif diff_days >= 28:
-                        result["frequency_hint"] = "Monthly"
-                    elif diff_days >= 7:
-                        result["frequency_hint"] = "Weekly"
-                    elif diff_days >= 1:
-                        result["frequency_hint"] = "Daily"
-                    elif diff_seconds >= 3600:
-                        result["frequency_hint"] = "Hourly"
-                    elif diff_seconds >= 60:
-                        result["frequency_hint"] = "Per minute"
-                    else:
-                        result["frequency_hint"] = "High frequency"
+                gaps, counts = np.unique(diffs, return_counts=True)
+                # Most common gap in integer nanoseconds (Python int: no overflow)
+                mode_ns = int(gaps[counts.argmax()]) * _NS_PER_UNIT[unit]
+                if mode_ns >= 365 * _DAY_NS:
+                    result["frequency_hint"] = "Yearly"
+                elif mode_ns >= 28 * _DAY_NS:
+                    result["frequency_hint"] = "Monthly"
+                elif mode_ns >= 7 * _DAY_NS:
+                    result["frequency_hint"] = "Weekly"
+                elif mode_ns >= _DAY_NS:
+                    result["frequency_hint"] = "Daily"
+                elif mode_ns >= _HOUR_NS:
+                    result["frequency_hint"] = "Hourly"
+                elif mode_ns >= _MINUTE_NS:
+                    result["frequency_hint"] = "Per minute"
+                else:
+                    result["frequency_hint"] = "High frequency"
             except Exception:  # pylint: disable=broad-except
                 result["frequency_hint"] = "Irregular"
         if result["missing_values"] / result["total_values"] > 0.5:
@@ -276,9 +443,12 @@ class DateTimeParser:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> pd.DataFrame:
-        filtered = df.copy()
+        # One combined mask and one take; boolean indexing already returns a
+        # new frame, so no upfront copy is needed.
+        dates = df[date_column]
+        mask = np.ones(len(df), dtype=bool)
         if start_date is not None:
-            filtered = filtered[filtered[date_column] >= start_date]
+            mask &= (dates >= start_date).to_numpy(dtype=bool, na_value=False)
         if end_date is not None:
-            filtered = filtered[filtered[date_column] <= end_date]
-        return filtered
+            mask &= (dates <= end_date).to_numpy(dtype=bool, na_value=False)
+        return df.loc[mask]
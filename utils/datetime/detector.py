@@ -9,6 +9,8 @@ from typing import Any, Dict, List
 
 import pandas as pd
 
+import config
+
 from .core import DateTimeParser  # reuse proven implementation
 
 __all__ = ["DateColumnDetector"]
@@ -27,6 +29,8 @@ class DateColumnDetector:
         self._impl = DateTimeParser()
 
     # Delegates ----------------------------------------------------------------
-    def detect(self, df: pd.DataFrame, sample_size: int = 100) -> List[Dict[str, Any]]:
+    def detect(
+        self, df: pd.DataFrame, sample_size: int = config.DETECTION_SAMPLE_SIZE
+    ) -> List[Dict[str, Any]]:
         """Return detection report (delegates to original parser)."""
         return self._impl.detect_datetime_columns(df, sample_size=sample_size)
@@ -3,31 +3,56 @@
 This sub-package houses reusable plotting utilities in smaller, focused
 modules.  The public surface is deliberately minimal at this stage; we only
 re-export the `BasePlotter` so existing code can migrate gradually.
+
+Chart builders (and with them Plotly's graph objects) are imported on first
+use, so importing this package at app start-up stays cheap.
 """
 
+import importlib
+
 from .base import BasePlotter  # noqa: F401
-from .line import create_line_chart  # noqa: F401
-from .scatter import create_scatter_plot  # noqa: F401
-from .bar import create_bar_chart  # noqa: F401
-from .area import create_area_chart  # noqa: F401
-from .box import create_box_plot  # noqa: F401
+from .downsample import downsample_frame, lttb_indices  # noqa: F401
 
 # Factory registry so callers can do utils.plot.create_plot('line', ...)
 import config as _cfg  # local config
 
-COLOR_PALETTES = _cfg.COLOR_PALETTES  # noqa: N806, re-export for pages
+get_color_palettes = _cfg.get_color_palettes  # re-export for pages
 
-_CREATORS = {
-    "line": create_line_chart,
-    "scatter": create_scatter_plot,
-    "bar": create_bar_chart,
-    "area": create_area_chart,
-    "box": create_box_plot,
+_CREATOR_PATHS = {
+    "line": (".line", "create_line_chart"),
+    "scatter": (".scatter", "create_scatter_plot"),
+    "bar": (".bar", "create_bar_chart"),
+    "area": (".area", "create_area_chart"),
+    "box": (".box", "create_box_plot"),
 }
+_CREATORS: dict = {}  # resolved builders, filled on first use
+
+
+def _resolve(plot_type: str):
+    """Import (once) and return the builder registered for *plot_type*."""
+    creator = _CREATORS.get(plot_type)
+    if creator is None:
+        module_name, attr = _CREATOR_PATHS[plot_type]
+        creator = getattr(importlib.import_module(module_name, __name__), attr)
+        _CREATORS[plot_type] = creator
+    return creator
+
 
 def create_plot(plot_type: str, *args, **kwargs):
     """Factory helper that dispatches to the right builder by *plot_type*."""
-    try:
-        return _CREATORS[plot_type.lower()](*args, **kwargs)
-    except KeyError as exc:
-        raise ValueError(f"Unsupported plot type: {plot_type}") from exc
+    creator = _CREATORS.get(plot_type)
+    if creator is None:
+        # Registry keys are lowercase; only other spellings pay for .lower()
+        key = plot_type if plot_type.islower() else plot_type.lower()
+        if key not in _CREATOR_PATHS:
+            raise ValueError(f"Unsupported plot type: {plot_type}")
+        creator = _resolve(key)
+    return creator(*args, **kwargs)
+
+
+def __getattr__(name: str):
+    """Keep ``from utils.plot import create_line_chart`` working lazily."""
+    for plot_type, (_, attr) in _CREATOR_PATHS.items():
+        if attr == name:
+            return _resolve(plot_type)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
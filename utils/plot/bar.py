@@ -1,13 +1,15 @@
 """Bar-chart builder."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
-import plotly.graph_objects as go
 
 from .base import BasePlotter
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 __all__ = ["create_bar_chart"]
 
 
@@ -17,22 +19,30 @@ def create_bar_chart(
     y_columns: List[str],
     config: Optional[Dict] = None,
 ) -> go.Figure:
+    import plotly.graph_objects as go  # deferred: heavy import
+
     bp = BasePlotter()
-    cfg = {**bp.default_config, **(config or {})}
+    cfg = bp._cfg(config)  # noqa: SLF001
 
-    fig = go.Figure()
     colors = bp._get_colors(len(y_columns), cfg.get("color_palette", "Default"))  # noqa: SLF001
 
-    for i, col in enumerate(y_columns):
-        fig.add_trace(
-            go.Bar(
-                x=df[x_column],
-                y=df[col],
-                name=col,
-                marker_color=colors[i % len(colors)],
-                opacity=cfg.get("opacity", 0.8),
-            )
+    opacity = cfg.get("opacity", 0.8)
+
+    # Plain arrays take Plotly's fast serialisation path
+    x_vals = bp._as_array(df[x_column])  # noqa: SLF001
+    traces = [
+        dict(
+            type="bar",
+            x=x_vals,
+            y=bp._as_array(df[col]),  # noqa: SLF001
+            name=col,
+            marker=dict(color=colors[i % len(colors)]),
+            opacity=opacity,
         )
+        for i, col in enumerate(y_columns)
+    ]
+    # Traces are built from known-good properties; skip per-property validation
+    fig = go.Figure(data=traces, _validate=False)
 
     bp._apply_layout(fig, cfg, x_column, y_columns)  # noqa: SLF001
     return fig
@@ -7,67 +7,164 @@ its static helpers.
 """
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Tuple
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots  # noqa: F401 – may be useful for builders
 
 import config
 
+from .downsample import downsample_frame
+from .trend import linreg_predict
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 __all__ = [
     "BasePlotter",
 ]
 
 
+@lru_cache(maxsize=128)
+def _palette_colors(n_colors: int, palette_name: str) -> Tuple[str, ...]:
+    """*n_colors* colours from *palette_name*, cycling; memoized (palettes are static)."""
+    palettes = config.get_color_palettes()
+    if palette_name in palettes:
+        colors = palettes[palette_name]
+        return tuple((colors * ((n_colors // len(colors)) + 1))[:n_colors])
+    return tuple(palettes["Default"][:n_colors])
+
+
+@lru_cache(maxsize=256)
+def _rgba(color: str, alpha: float) -> str:
+    """``rgba()`` string for a ``#rrggbb`` colour; memoized (a handful of pairs recur)."""
+    if color.startswith("#") and len(color) == 7:
+        v = int(color[1:], 16)
+        return f"rgba({v >> 16},{(v >> 8) & 0xFF},{v & 0xFF},{alpha})"
+    return color  # already rgba or named
+
+
+_DEFAULTS: Mapping = MappingProxyType(config.DEFAULT_PLOT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def _kaleido_scope():
+    """Process-wide warm Kaleido scope, or ``None`` if unavailable.
+
+    ``fig.to_image`` starts a fresh Chromium process on each call; reusing the
+    scope keeps one running between exports.  Resolved on first export so
+    nothing imports Kaleido up front.
+    """
+    try:
+        from plotly.io._kaleido import scope  # type: ignore[attr-defined]
+    except ImportError:
+        return None
+    if scope is None or not hasattr(scope, "transform"):
+        return None  # Kaleido >= 1.0 no longer exposes a reusable scope
+    if "--single-process" not in scope.chromium_args:
+        scope.chromium_args += ("--single-process",)
+    return scope
+
+
 class BasePlotter:  # pylint: disable=too-few-public-methods
     """Common utilities for all plot builders."""
 
-    COLOR_PALETTES = config.COLOR_PALETTES  # type: ignore[attr-defined]
-
     def __init__(self, default_cfg: Dict | None = None):
-        # copy() to avoid mutating global dict
-        self.default_config: Dict = {
-            **config.DEFAULT_PLOT_CONFIG,  # type: ignore[attr-defined]
-            **(default_cfg or {}),
-        }
+        # Read-only view of the global defaults unless overrides are given;
+        # nothing writes through it, so it need not be copied per instance
+        self.default_config: Mapping = (
+            {**_DEFAULTS, **default_cfg} if default_cfg else _DEFAULTS
+        )
+
+    def _cfg(self, user: Dict | None) -> Mapping:
+        """Defaults merged with *user* overrides; no merge when there are none."""
+        if not user:
+            return self.default_config
+        return {**self.default_config, **user}
 
     # ---------------------------------------------------------------------
     # Colour and style helpers
     # ---------------------------------------------------------------------
-    @classmethod
-    def _get_colors(cls, n_colors: int, palette_name: str = "Default") -> List[str]:
+    @staticmethod
+    def _get_colors(n_colors: int, palette_name: str = "Default") -> Tuple[str, ...]:
         """Return *n_colors* hex strings from the chosen palette."""
-        if palette_name in cls.COLOR_PALETTES:
-            colors = cls.COLOR_PALETTES[palette_name]
-            return (colors * ((n_colors // len(colors)) + 1))[:n_colors]
-        return px.colors.qualitative.Plotly[:n_colors]
+        return _palette_colors(n_colors, palette_name)
 
     @staticmethod
     def _add_transparency(color: str, alpha: float) -> str:
         """Convert a hex colour to an rgba string with *alpha* transparency."""
-        if color.startswith("#") and len(color) == 7:
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            return f"rgba({r},{g},{b},{alpha})"
-        return color  # already rgba or named
+        return _rgba(color, alpha)
+
+    # ------------------------------------------------------------------
+    # Data helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _as_array(values) -> np.ndarray:
+        """*values* (ndarray, Series, Index or sequence) as a NumPy array.
+
+        Traces get plain arrays, which Plotly serialises without its
+        per-element coercion of Series and lists.
+        """
+        if isinstance(values, np.ndarray):
+            return values
+        if hasattr(values, "to_numpy"):
+            return values.to_numpy(copy=False)
+        return np.asarray(values)
+
+    @staticmethod
+    def _maybe_downsample(
+        df: pd.DataFrame, x_column: str, y_columns: List[str], cfg: Mapping
+    ) -> pd.DataFrame:
+        """LTTB-reduce *df* when it has more rows than the browser needs.
+
+        Frames above ``cfg["downsample_threshold"]`` rows keep at most
+        ``cfg["downsample_points"]`` rows per y column (defaults from
+        ``config``); ``cfg["downsample"] = False`` turns this off.
+        """
+        threshold = cfg.get("downsample_threshold", config.DOWNSAMPLE_THRESHOLD)
+        if not cfg.get("downsample", True) or len(df) <= threshold:
+            return df
+        return downsample_frame(
+            df, x_column, y_columns, cfg.get("downsample_points", config.DOWNSAMPLE_POINTS)
+        )
 
     # ------------------------------------------------------------------
     # Figure-level helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _apply_layout(fig: go.Figure, cfg: Dict, x_label: str, y_columns: List[str]):
+    def _apply_layout(fig: go.Figure, cfg: Mapping, x_label: str, y_columns: List[str]):
         """Apply titles, theme and axis tweaks to *fig* using *cfg*."""
+        import plotly.io as pio  # deferred: heavy import
+
+        # Titles in object form: figures from the builders skip validation,
+        # which would otherwise expand a bare string (dropped by Plotly.js 3)
+        xaxis: Dict = {"title": {"text": cfg.get("x_title", x_label)}}
+        yaxis: Dict = {"title": {"text": cfg.get("y_title", ", ".join(y_columns))}}
+        if cfg.get("x_range") is not None:
+            xaxis["range"] = cfg["x_range"]
+        if cfg.get("y_range") is not None:
+            yaxis["range"] = cfg["y_range"]
+        if cfg.get("log_x", False):
+            xaxis["type"] = "log"
+        if cfg.get("log_y", False):
+            yaxis["type"] = "log"
+        if cfg.get("show_grid", True):
+            grid = dict(showgrid=True, gridwidth=1, gridcolor="lightgray")
+            xaxis.update(grid)
+            yaxis.update(grid)
+
+        # One update_layout call, so the layout is validated once
         fig.update_layout(
-            title=cfg.get("title", f"{', '.join(y_columns)} vs {x_label}"),
-            xaxis_title=cfg.get("x_title", x_label),
-            yaxis_title=cfg.get("y_title", ", ".join(y_columns)),
+            title={"text": cfg.get("title", f"{', '.join(y_columns)} vs {x_label}")},
+            xaxis=xaxis,
+            yaxis=yaxis,
             width=cfg.get("width", 800),
             height=cfg.get("height", 500),
-            template=cfg.get("theme", "plotly_white"),
+            # Resolved here: unvalidated figures would keep the bare name,
+            # which neither Plotly.js nor to_html understands
+            template=pio.templates[cfg.get("theme", "plotly_white")],
             font=dict(size=cfg.get("font_size", 12)),
             hovermode="x unified" if cfg.get("unified_hover", True) else "closest",
             legend=dict(
@@ -79,47 +176,60 @@ class BasePlotter:  # pylint: disable=too-few-public-methods
             ),
         )
 
-        # axis options
-        if cfg.get("x_range") is not None:
-            fig.update_xaxes(range=cfg["x_range"])
-        if cfg.get("y_range") is not None:
-            fig.update_yaxes(range=cfg["y_range"])
-        if cfg.get("log_y", False):
-            fig.update_yaxes(type="log")
-        if cfg.get("log_x", False):
-            fig.update_xaxes(type="log")
-        if cfg.get("show_grid", True):
-            fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor="lightgray")
-            fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor="lightgray")
-
     # ------------------------------------------------------------------
     # Statistical helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _add_trendline(fig: go.Figure, x_data: pd.Series, y_data: pd.Series, color: str):
-        """Add a simple first-order poly trend line to *fig*.  Silently skips on errors."""
+    def _trend_axis(x_data: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Numeric view of *x_data* for trend fitting, plus its validity mask.
+
+        Datetimes reinterpret their epoch ticks in place rather than being
+        converted.  Compute once per figure and share across trendlines.
+        """
+        if pd.api.types.is_datetime64_any_dtype(x_data):
+            ticks = pd.DatetimeIndex(x_data)
+            return ticks.asi8, ~ticks.isna()
+        x_numeric = pd.to_numeric(x_data, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        return x_numeric, np.isfinite(x_numeric)
+
+    @staticmethod
+    def _trendline_trace(
+        x_data,
+        y_data: pd.Series,
+        color: str,
+        x_axis: Tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> Dict | None:
+        """Least-squares trend line as a trace dict, or ``None`` when it can't be fitted.
+
+        Fits on every point given, so pass the full series rather than a
+        downsampled one.  The line is straight, so the trace only carries
+        its two endpoints at the smallest and largest valid x.
+        *x_axis* is ``_trend_axis(x_data)``, when the caller already has it.
+        """
         try:
-            x_numeric = (
-                pd.to_numeric(x_data) if pd.api.types.is_datetime64_any_dtype(x_data) else x_data
+            x_numeric, x_valid = x_axis if x_axis is not None else BasePlotter._trend_axis(x_data)
+            y_numeric = pd.to_numeric(y_data, errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
             )
-            mask = ~(pd.isna(x_numeric) | pd.isna(y_data))
-            x_clean = x_numeric[mask]
-            y_clean = y_data[mask]
-            if len(x_clean) > 1:
-                z = np.polyfit(x_clean, y_clean, 1)
-                p = np.poly1d(z)
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_data,
-                        y=p(x_numeric),
-                        mode="lines",
-                        name="Trend",
-                        line=dict(dash="dash", color=color, width=1),
-                        opacity=0.7,
-                    )
-                )
+            fitted = linreg_predict(x_numeric, y_numeric, x_valid)
         except Exception:  # pylint: disable=broad-except
-            pass
+            return None
+        if fitted is None:
+            return None
+        valid_positions = np.flatnonzero(x_valid)
+        x_valid_numeric = x_numeric[valid_positions]
+        ends = valid_positions[[x_valid_numeric.argmin(), x_valid_numeric.argmax()]]
+        return dict(
+            type="scatter",
+            x=BasePlotter._as_array(x_data)[ends],
+            y=fitted[ends],
+            mode="lines",
+            name="Trend",
+            line=dict(dash="dash", color=color, width=1),
+            opacity=0.7,
+        )
 
     # ------------------------------------------------------------------
     # Export helpers
@@ -131,10 +241,22 @@ class BasePlotter:  # pylint: disable=too-few-public-methods
         width: int = 800,
         height: int = 500,
         scale: int = 2,
+        self_contained: bool = False,
     ) -> bytes:
-        """Return the raw bytes for *fig* in the requested format."""
-        if format_.lower() == "html":
-            return fig.to_html(include_plotlyjs=True).encode()
-        if format_.lower() in {"png", "jpeg", "svg", "pdf"}:
-            return fig.to_image(format=format_.lower(), width=width, height=height, scale=scale)
+        """Return the raw bytes for *fig* in the requested format.
+
+        HTML loads Plotly.js from its CDN unless *self_contained*, which embeds
+        the ~3.5 MB library so the file also opens offline.  Images render
+        through the shared warm Kaleido scope when available.
+        """
+        fmt = format_.lower()
+        if fmt == "html":
+            return fig.to_html(
+                include_plotlyjs=True if self_contained else "cdn", full_html=True
+            ).encode("utf-8")
+        if fmt in {"png", "jpeg", "svg", "pdf"}:
+            scope = _kaleido_scope()
+            if scope is not None:
+                return scope.transform(fig, format=fmt, width=width, height=height, scale=scale)
+            return fig.to_image(format=fmt, width=width, height=height, scale=scale)
         raise ValueError(f"Unsupported export format: {format_}")
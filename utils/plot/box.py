@@ -1,13 +1,15 @@
 """Box-plot builder."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
-import plotly.graph_objects as go
 
 from .base import BasePlotter
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 __all__ = ["create_box_plot"]
 
 
@@ -17,39 +19,46 @@ def create_box_plot(
     y_columns: List[str],
     config: Optional[Dict] = None,
 ) -> go.Figure:
-    bp = BasePlotter()
-    cfg = {**bp.default_config, **(config or {})}
+    import plotly.graph_objects as go  # deferred: heavy import
 
-    # Prepare grouping on copy to avoid mutating original
-    dfc = df.copy()
+    bp = BasePlotter()
+    cfg = bp._cfg(config)  # noqa: SLF001
 
-    if pd.api.types.is_datetime64_any_dtype(dfc[x_column]):
-        span = dfc[x_column].max() - dfc[x_column].min()
+    # Group labels as a categorical: only the distinct groups are formatted
+    # as strings, never one string per row.  The input frame is not copied.
+    x = df[x_column]
+    if pd.api.types.is_datetime64_any_dtype(x):
+        span = x.max() - x.min()
         if span.days > 730:
-            dfc["time_group"] = dfc[x_column].dt.to_period("Y").astype(str)
+            periods = x.dt.to_period("Y")
         elif span.days > 60:
-            dfc["time_group"] = dfc[x_column].dt.to_period("M").astype(str)
+            periods = x.dt.to_period("M")
         else:
-            dfc["time_group"] = dfc[x_column].dt.to_period("D").astype(str)
+            periods = x.dt.to_period("D")
+        codes, groups = pd.factorize(periods, sort=True)
+        time_group = pd.Series(
+            pd.Categorical.from_codes(codes, groups.astype(str)), index=x.index
+        )
     else:
-        dfc["time_group"] = pd.cut(dfc[x_column], bins=10).astype(str)
+        time_group = pd.cut(x, bins=10, include_lowest=True).cat.rename_categories(str)
 
-    fig = go.Figure()
     colors = bp._get_colors(len(y_columns), cfg.get("color_palette", "Default"))  # noqa: SLF001
 
-    for i, col in enumerate(y_columns):
-        for grp in dfc["time_group"].unique():
-            subset = dfc[dfc["time_group"] == grp][col].dropna()
-            if not subset.empty:
-                fig.add_trace(
-                    go.Box(
-                        y=subset,
-                        x=[grp] * len(subset),
-                        name=f"{col} - {grp}",
-                        marker_color=colors[i % len(colors)],
-                        showlegend=(i == 0),
-                    )
-                )
+    # One trace per column; Plotly splits it into a box per distinct x value.
+    # Plain arrays take Plotly's fast serialisation path.
+    group_vals = bp._as_array(time_group)  # noqa: SLF001
+    traces = [
+        dict(
+            type="box",
+            x=group_vals,
+            y=bp._as_array(df[col]),  # noqa: SLF001
+            name=col,
+            marker=dict(color=colors[i % len(colors)]),
+        )
+        for i, col in enumerate(y_columns)
+    ]
+    # Traces are built from known-good properties; skip per-property validation
+    fig = go.Figure(data=traces, layout=dict(boxmode="group"), _validate=False)
 
     bp._apply_layout(fig, cfg, "Time Groups", y_columns)  # noqa: SLF001
     return fig
@@ -0,0 +1,151 @@
+"""Largest-Triangle-Three-Buckets (LTTB) downsampling for large time series.
+
+Plotly ships every point to the browser, so a million-row line chart means
+tens of MB of JSON and a stalled tab.  LTTB keeps the points that carry the
+visual shape of a series; ~2000 of them are indistinguishable from the full
+series at screen resolution.
+
+The SIMD/Rust implementation from ``tsdownsample`` is used when installed,
+then a Numba-compiled loop, otherwise a NumPy version with one vectorised
+step per bucket.
+"""
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+try:
+    from tsdownsample import LTTBDownsampler  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    LTTBDownsampler = None
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+
+__all__ = ["lttb_indices", "downsample_frame"]
+
+
+def _lttb_numpy(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    n = x.size
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < edges.size:
+            nxt = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def _lttb_loop(x: np.ndarray, y: np.ndarray, edges: np.ndarray, selected: np.ndarray) -> None:
+    """Scalar LTTB over precomputed bucket *edges*; fills *selected*.
+
+    Same selection as ``_lttb_numpy``, written as plain loops for Numba.
+    """
+    n = x.size
+    n_buckets = selected.size - 2
+    a = 0
+    for i in range(n_buckets):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < edges.size:
+            nxt_lo, nxt_hi = edges[i + 1], edges[i + 2]
+            avg_x = 0.0
+            avg_y = 0.0
+            for j in range(nxt_lo, nxt_hi):
+                avg_x += x[j]
+                avg_y += y[j]
+            avg_x /= nxt_hi - nxt_lo
+            avg_y /= nxt_hi - nxt_lo
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        a = best
+        selected[i + 1] = a
+
+
+_lttb_jit = njit(cache=True, nogil=True)(_lttb_loop) if njit is not None else None
+
+
+def _lttb_compiled(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    n = x.size
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    _lttb_jit(
+        np.ascontiguousarray(x, dtype=np.float64),
+        np.ascontiguousarray(y, dtype=np.float64),
+        edges,
+        selected,
+    )
+    return selected
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return the sorted positions of the *n_out* points LTTB keeps.
+
+    *x* must be sorted ascending and both arrays free of NaN.
+    """
+    n = x.size
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    if LTTBDownsampler is not None:
+        return np.asarray(LTTBDownsampler().downsample(x, y, n_out=n_out, parallel=True))
+    if _lttb_jit is not None:
+        return _lttb_compiled(x, y, n_out)
+    return _lttb_numpy(x, y, n_out)
+
+
+def _numeric_axis(values: pd.Series) -> np.ndarray:
+    """float64 view of *values*; datetimes become epoch nanoseconds, NaT/NaN -> NaN."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        if getattr(values.dt, "tz", None) is not None:
+            values = values.dt.tz_localize(None)
+        out = values.to_numpy(dtype="datetime64[ns]").view("i8").astype(np.float64)
+        out[values.isna().to_numpy()] = np.nan
+        return out
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def downsample_frame(
+    df: pd.DataFrame, x_column: str, y_columns: List[str], n_out: int
+) -> pd.DataFrame:
+    """Return the rows of *df* LTTB keeps for any of *y_columns*.
+
+    Each column is downsampled on its own and the kept rows are merged, so
+    every plotted series keeps its shape (at most ``n_out`` rows per column).
+    Rows come back ordered by *x_column*.
+    """
+    x = _numeric_axis(df[x_column])
+    order = np.argsort(x, kind="stable")  # NaN sorts last
+    x_sorted = x[order]
+
+    keep: List[np.ndarray] = []
+    for col in y_columns:
+        y_sorted = _numeric_axis(df[col])[order]
+        valid = ~(np.isnan(x_sorted) | np.isnan(y_sorted))
+        positions = np.flatnonzero(valid)
+        picked = lttb_indices(x_sorted[valid], y_sorted[valid], n_out)
+        keep.append(positions[picked])
+
+    if not keep:
+        return df
+    return df.iloc[order[np.unique(np.concatenate(keep))]]
@@ -1,13 +1,15 @@
 """Line-chart builder."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
-import plotly.graph_objects as go
 
 from .base import BasePlotter
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 __all__ = ["create_line_chart"]
 
 
@@ -18,24 +20,37 @@ def create_line_chart(
     config: Optional[Dict] = None,
 ) -> go.Figure:
     """Return a Plotly Figure representing a time-series line chart."""
+    import plotly.graph_objects as go  # deferred: heavy import
+
     bp = BasePlotter()
-    cfg = {**bp.default_config, **(config or {})}
+    cfg = bp._cfg(config)  # noqa: SLF001
+    df = bp._maybe_downsample(df, x_column, y_columns, cfg)  # noqa: SLF001
 
-    fig = go.Figure()
     colors = bp._get_colors(len(y_columns), cfg.get("color_palette", "Default"))  # noqa: SLF001
 
-    for i, col in enumerate(y_columns):
-        fig.add_trace(
-            go.Scatter(
-                x=df[x_column],
-                y=df[col],
-                mode="lines+markers" if cfg.get("show_markers", True) else "lines",
-                name=col,
-                line=dict(width=cfg.get("line_width", 2), color=colors[i % len(colors)]),
-                marker=dict(size=cfg.get("marker_size", 6), opacity=cfg.get("opacity", 0.8)),
-                opacity=cfg.get("opacity", 0.8),
-            )
+    # Per-figure settings resolved once; traces only differ in data and colour
+    mode = "lines+markers" if cfg.get("show_markers", True) else "lines"
+    line_width = cfg.get("line_width", 2)
+    marker = dict(size=cfg.get("marker_size", 6), opacity=cfg.get("opacity", 0.8))
+    opacity = cfg.get("opacity", 0.8)
+
+    # Plain arrays take Plotly's fast serialisation path
+    x_vals = bp._as_array(df[x_column])  # noqa: SLF001
+    traces = [
+        dict(
+            type="scatter",
+            x=x_vals,
+            y=bp._as_array(df[col]),  # noqa: SLF001
+            mode=mode,
+            name=col,
+            line=dict(width=line_width, color=colors[i % len(colors)]),
+            marker=marker,
+            opacity=opacity,
         )
+        for i, col in enumerate(y_columns)
+    ]
+    # Traces are built from known-good properties; skip per-property validation
+    fig = go.Figure(data=traces, _validate=False)
 
     bp._apply_layout(fig, cfg, x_column, y_columns)  # noqa: SLF001
     return fig
@@ -1,13 +1,15 @@
 """Scatter-plot builder."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
-import plotly.graph_objects as go
 
 from .base import BasePlotter
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 __all__ = ["create_scatter_plot"]
 
 
@@ -18,29 +20,54 @@ def create_scatter_plot(
     config: Optional[Dict] = None,
 ) -> go.Figure:
     """Return a scatter Plotly Figure."""
-    bp = BasePlotter()
-    cfg = {**bp.default_config, **(config or {})}
+    import plotly.graph_objects as go  # deferred: heavy import
 
-    fig = go.Figure()
+    bp = BasePlotter()
+    cfg = bp._cfg(config)  # noqa: SLF001
     colors = bp._get_colors(len(y_columns), cfg.get("color_palette", "Default"))  # noqa: SLF001
 
+    # Trend lines are fitted on every row: LTTB keeps extremes on purpose,
+    # so a fit on the downsampled markers would be biased
+    trends: Dict[str, Dict] = {}
+    if cfg.get("show_trendline", False):
+        x_full = df[x_column]
+        x_axis = bp._trend_axis(x_full)  # noqa: SLF001
+        for i, col in enumerate(y_columns):
+            trend = bp._trendline_trace(x_full, df[col], colors[i % len(colors)], x_axis)  # noqa: SLF001
+            if trend is not None:
+                trends[col] = trend
+
+    df = bp._maybe_downsample(df, x_column, y_columns, cfg)  # noqa: SLF001
+
+    # Per-figure marker settings resolved once; traces only add their colour
+    marker_size = cfg.get("marker_size", 8)
+    marker_opacity = cfg.get("opacity", 0.7)
+    marker_line = dict(width=1, color="white")
+
+    # Plain arrays take Plotly's fast serialisation path
+    x_vals = bp._as_array(df[x_column])  # noqa: SLF001
+
+    traces = []
     for i, col in enumerate(y_columns):
-        fig.add_trace(
-            go.Scatter(
-                x=df[x_column],
-                y=df[col],
+        color = colors[i % len(colors)]
+        traces.append(
+            dict(
+                type="scatter",
+                x=x_vals,
+                y=bp._as_array(df[col]),  # noqa: SLF001
                 mode="markers",
                 name=col,
                 marker=dict(
-                    size=cfg.get("marker_size", 8),
-                    color=colors[i % len(colors)],
-                    opacity=cfg.get("opacity", 0.7),
-                    line=dict(width=1, color="white"),
+                    size=marker_size, color=color, opacity=marker_opacity, line=marker_line
                 ),
             )
         )
-        if cfg.get("show_trendline", False):
-            bp._add_trendline(fig, df[x_column], df[col], colors[i % len(colors)])  # noqa: SLF001
+        if col in trends:
+            traces.append(trends[col])
+
+    # All traces, trendlines included, go to the Figure in one batch;
+    # they are built from known-good properties, so validation is skipped
+    fig = go.Figure(data=traces, _validate=False)
 
     bp._apply_layout(fig, cfg, x_column, y_columns)  # noqa: SLF001
     return fig
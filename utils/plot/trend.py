@@ -0,0 +1,88 @@
+"""Least-squares trend lines for scatter charts.
+
+A Numba-compiled single-pass kernel is used when numba is installed,
+otherwise the same closed-form fit in NumPy.  Both fit on centred values,
+which keeps the sums well conditioned for epoch-tick x values.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+
+__all__ = ["linreg_predict"]
+
+
+def _linreg_loop(x: np.ndarray, y: np.ndarray, valid: np.ndarray, out: np.ndarray) -> bool:
+    """Fit y ~ x over valid, finite points and write the line at every x into *out*.
+
+    Plain loops for Numba; returns False when no line can be fitted.
+    """
+    n = 0
+    sx = 0.0
+    sy = 0.0
+    for i in range(x.size):
+        if valid[i] and np.isfinite(y[i]):
+            n += 1
+            sx += x[i]
+            sy += y[i]
+    if n < 2:
+        return False
+    mx = sx / n
+    my = sy / n
+    sxx = 0.0
+    sxy = 0.0
+    for i in range(x.size):
+        if valid[i] and np.isfinite(y[i]):
+            dx = x[i] - mx
+            sxx += dx * dx
+            sxy += dx * (y[i] - my)
+    if sxx == 0.0:
+        return False
+    slope = sxy / sxx
+    for i in range(x.size):
+        out[i] = slope * (x[i] - mx) + my
+    return True
+
+
+_linreg_jit = njit(cache=True, nogil=True)(_linreg_loop) if njit is not None else None
+
+
+def _linreg_numpy(x: np.ndarray, y: np.ndarray, valid: np.ndarray) -> Optional[np.ndarray]:
+    mask = valid & np.isfinite(y)
+    x_clean = x[mask]
+    y_clean = y[mask]
+    if len(x_clean) < 2:
+        return None
+    mx = x_clean.mean()
+    my = y_clean.mean()
+    dx = x_clean - mx
+    sxx = np.dot(dx, dx)
+    if sxx == 0:
+        return None
+    slope = np.dot(dx, y_clean - my) / sxx
+    return slope * (x - mx) + my
+
+
+def linreg_predict(x: np.ndarray, y: np.ndarray, valid: np.ndarray) -> Optional[np.ndarray]:
+    """Least-squares line through the points where *valid* and *y* is finite.
+
+    Returns the fitted values at every *x* (float64), or ``None`` when fewer
+    than two points remain or all their x values coincide.
+    """
+    if _linreg_jit is None:
+        return _linreg_numpy(x, y, valid)
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    out = np.empty(x.size, dtype=np.float64)
+    fitted = _linreg_jit(
+        x,
+        np.ascontiguousarray(y, dtype=np.float64),
+        np.ascontiguousarray(valid, dtype=np.bool_),
+        out,
+    )
+    return out if fitted else None
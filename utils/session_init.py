@@ -13,51 +13,28 @@ from utils.file_handler import FileHandler
 from utils import datetime as dt_mod
 from utils import plot as plot_mod
 
-__all__ = ["ensure_session_state"]
+__all__ = ["ensure_session_state", "forget_dataset_state"]
 
+# Session keys holding per-dataset results, suffixed with the dataset name
+_DATASET_KEY_PREFIXES = ("datetime_candidates_", "parsed_time_")
 
-def _hide_unwanted_pages() -> None:
-    """Remove unnecessary pages from Streamlit navigation sidebar.
 
-    This relies on the *experimental* ``st.experimental_get_pages`` API that
-    returns the internal page registry as a ``dict``.  By deleting keys from
-    this mapping **before** the first widget is rendered, the corresponding
-    entries disappear from the sidebar navigation.
-    """
-
-    try:
-        import streamlit as _st  # local import to avoid polluting public namespace
-
-        pages = _st.experimental_get_pages()  # type: ignore[attr-defined]
-        for key, page in list(pages.items()):
-            if (
-                page.get("page_name") in {"App", "Utils Date Analysis"}
-                or page.get("module") in {"app", "pages.utils_date_analysis"}
-                or page.get("module", "").endswith("app")
-                or page.get("module", "").endswith("utils_date_analysis")
-            ):
-                del pages[key]
-    except Exception:
-        # Fail silently if Streamlit version does not expose the helper
-        # _or_ if its internals change in the future. The worst-case outcome
-        # is that the redundant pages remain visible, which is acceptable.
-        pass
+@st.cache_resource(show_spinner=False)
+def _datetime_parser():
+    """Process-wide parser; it holds no per-session state, so sessions share it."""
+    return dt_mod.DateParser()._impl  # type: ignore
 
 
 def ensure_session_state() -> None:
-    """Populate missing objects in ``st.session_state`` and clean sidebar."""
-
-    # Remove navigation entries that the product does not expose to end users
-    _hide_unwanted_pages()
-
-
+    """Populate missing objects in ``st.session_state``."""
 
     if "file_handler" not in st.session_state:
+        # Per session: the handler owns the session's uploaded datasets
         st.session_state.file_handler = FileHandler()
 
     if "datetime_parser" not in st.session_state:
         # keep backward compat: store original parser instance
-        st.session_state.datetime_parser = dt_mod.DateParser()._impl  # type: ignore
+        st.session_state.datetime_parser = _datetime_parser()
 
     if "datetime" not in st.session_state:
         st.session_state.datetime = dt_mod
@@ -69,3 +46,19 @@ def ensure_session_state() -> None:
     # Shared mutable containers for datasets
     st.session_state.setdefault("current_datasets", {})
     st.session_state.setdefault("parsed_datasets", {})
+
+
+def forget_dataset_state(name: str | None = None) -> None:
+    """Drop the detection and parsing results kept for dataset *name*.
+
+    Call when a dataset is removed so a later one under the same name does
+    not inherit them; ``None`` forgets every dataset's results.
+    """
+    if name is None:
+        st.session_state.parsed_datasets.clear()
+        for key in [k for k in st.session_state.keys() if k.startswith(_DATASET_KEY_PREFIXES)]:
+            del st.session_state[key]
+        return
+    st.session_state.parsed_datasets.pop(name, None)
+    for prefix in _DATASET_KEY_PREFIXES:
+        st.session_state.pop(f"{prefix}{name}", None)
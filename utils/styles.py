@@ -47,9 +47,9 @@ _GLOBAL_CSS = """
 """
 
 def inject_global_css() -> None:
-    """Inject the shared CSS into the current Streamlit page only once."""
-    if _GLOBAL_CSS not in st.session_state.get("_injected_css", set()):
-        st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
-        injected = st.session_state.get("_injected_css", set())
-        injected.add(_GLOBAL_CSS)
-        st.session_state._injected_css = injected
+    """Inject the shared CSS into the current Streamlit page.
+
+    Elements only live for the run that emits them, so the style block is
+    written on every run; a single static markdown call is all it costs.
+    """
+    st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)